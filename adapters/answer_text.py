@@ -0,0 +1,46 @@
+"""
+Post-processing helpers for generated answer text (no torch dependency).
+"""
+
+
+def json_scan_state() -> dict:
+    return {"depth": 0, "in_string": False, "escape": False, "done": False}
+
+
+def scan_json(state: dict, text: str) -> int:
+    """
+    Feeds `text` into the brace-matching state and returns the index just past the closing brace of the first
+    top-level object, or -1 if it is not closed yet. Braces inside string literals are ignored.
+    """
+    for i, ch in enumerate(text):
+        if state["in_string"]:
+            if state["escape"]:
+                state["escape"] = False
+            elif ch == "\\":
+                state["escape"] = True
+            elif ch == '"':
+                state["in_string"] = False
+        elif ch == '"' and state["depth"] > 0:
+            state["in_string"] = True
+        elif ch == "{":
+            state["depth"] += 1
+        elif ch == "}" and state["depth"] > 0:
+            state["depth"] -= 1
+            if state["depth"] == 0:
+                state["done"] = True
+                return i + 1
+    return -1
+
+
+def truncate_after_json(text: str) -> str:
+    """Cuts `text` right after the first balanced top-level JSON object (unchanged if none is closed)."""
+    end = scan_json(json_scan_state(), text)
+    return text[:end] if end >= 0 else text
+
+
+def truncate_at_stop(text: str, stop: list[str] | None) -> str:
+    """Cuts `text` at the earliest occurrence of any stop sequence."""
+    if not stop:
+        return text
+    cut = min((i for i in (text.find(s) for s in stop if s) if i >= 0), default=len(text))
+    return text[:cut]
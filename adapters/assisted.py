@@ -0,0 +1,97 @@
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class DecodingStats:
+    new_tokens: int = 0
+    elapsed_s: float = 0.0
+    target_forwards: int = 0
+    draft_forwards: int = 0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.new_tokens / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def accepted_tokens(self) -> int:
+        # draft 없이 디코딩했으면 수락분도 없음(배치 디코딩에서 new_tokens 가 행 수만큼 커지는 경우 포함)
+        if not self.draft_forwards:
+            return 0
+        # 검증 패스마다 본 모델이 1토큰(수정/보너스)을 직접 생성하므로 나머지가 draft 수락분
+        return max(0, self.new_tokens - self.target_forwards)
+
+    @property
+    def acceptance_rate(self) -> float:
+        return self.accepted_tokens / self.draft_forwards if self.draft_forwards else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            **asdict(self),
+            "tokens_per_second": self.tokens_per_second,
+            "accepted_tokens": self.accepted_tokens,
+            "acceptance_rate": self.acceptance_rate,
+        }
+
+
+class DecodingMonitor:
+    """
+    Counts forward passes of the target and (optional) draft model around a generate call.
+    With assisted decoding each draft forward proposes one candidate token and each target forward verifies a batch.
+    """
+
+    def __init__(self, model: Any, draft_model: Any = None):
+        self.model = model
+        self.draft_model = draft_model
+        self.stats = DecodingStats()
+        self._handles: list = []
+        self._start = 0.0
+
+    def _count(self, attr: str):
+        def hook(module, args, output):
+            setattr(self.stats, attr, getattr(self.stats, attr) + 1)
+
+        return hook
+
+    def __enter__(self) -> "DecodingMonitor":
+        self._handles.append(self.model.register_forward_hook(self._count("target_forwards")))
+        if self.draft_model is not None:
+            self._handles.append(self.draft_model.register_forward_hook(self._count("draft_forwards")))
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stats.elapsed_s = time.perf_counter() - self._start
+        for handle in self._handles:
+            handle.remove()
+        self._handles.clear()
+
+
+def count_new_tokens(generate_ids: Any, eos_token_id: int | list[int] | None) -> int:
+    """
+    Counts generated tokens per row up to and including the first EOS, so padding after EOS is not counted
+    (and EOS itself still is when pad_token_id == eos_token_id).
+    """
+    import torch
+
+    if eos_token_id is None:
+        return generate_ids.numel()
+    eos_ids = torch.tensor(
+        eos_token_id if isinstance(eos_token_id, list) else [eos_token_id], device=generate_ids.device
+    )
+    is_eos = torch.isin(generate_ids, eos_ids)
+    first_eos = is_eos.int().argmax(dim=1)
+    lengths = torch.where(is_eos.any(dim=1), first_eos + 1, torch.full_like(first_eos, generate_ids.shape[1]))
+    return int(lengths.sum())
+
+
+def with_draft_model(generate_kwargs: dict, draft_model: Any = None, num_assistant_tokens: int | None = None) -> dict:
+    """Wire a draft model into generate_kwargs as a Hugging Face `assistant_model`."""
+    if draft_model is None:
+        return generate_kwargs
+    generate_kwargs = {**generate_kwargs, "assistant_model": draft_model}
+    if num_assistant_tokens is not None:
+        # transformers 는 draft 모델의 generation_config 에서 후보 토큰 수를 읽음
+        draft_model.generation_config.num_assistant_tokens = num_assistant_tokens
+    return generate_kwargs
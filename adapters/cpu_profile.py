@@ -0,0 +1,77 @@
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CpuProfile:
+    name: str
+    dtype: torch.dtype = torch.float32
+    quantize_int8: bool = False  # Linear 레이어 dynamic int8 양자화
+    num_threads: int | None = None  # intra-op 스레드 수(None 이면 torch 기본값)
+    compile: bool = False
+
+
+CPU_PROFILES: dict[str, CpuProfile] = {
+    "fp32": CpuProfile(name="fp32"),
+    "bf16": CpuProfile(name="bf16", dtype=torch.bfloat16),
+    "int8": CpuProfile(name="int8", quantize_int8=True),
+}
+
+
+def cpu_supports_bf16() -> bool:
+    """
+    True only when the CPU has native bf16 instructions (AVX512-BF16 or AMX).
+    oneDNN's own bf16 check also passes on plain AVX512 CPUs where bf16 is emulated and slower than fp32.
+    """
+    checks = [getattr(torch.cpu, name, None) for name in ("_is_avx512_bf16_supported", "_is_amx_tile_supported")]
+    checks = [c for c in checks if c is not None]
+    if checks:
+        return any(bool(c()) for c in checks)
+    # 구버전 torch: CPU 플래그 직접 확인(Linux)
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="ignore") as f:
+            flags = next((line.split(":", 1)[1].split() for line in f if line.startswith("flags")), [])
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
+
+def resolve_cpu_profile(profile: str | CpuProfile, num_threads: int | None = None) -> CpuProfile:
+    if isinstance(profile, str):
+        if profile not in CPU_PROFILES:
+            raise ValueError(f"Unknown CPU profile: {profile!r} (available: {', '.join(CPU_PROFILES)})")
+        profile = CPU_PROFILES[profile]
+    if num_threads is not None:
+        profile = CpuProfile(profile.name, profile.dtype, profile.quantize_int8, num_threads, profile.compile)
+    if profile.dtype == torch.bfloat16 and not cpu_supports_bf16():
+        # bf16 미지원 CPU 에서는 에뮬레이션으로 오히려 느려지므로 fp32 로 대체
+        logger.warning("CPU has no native bf16 support; falling back to float32 for profile %s", profile.name)
+        profile = CpuProfile(profile.name, torch.float32, profile.quantize_int8, profile.num_threads, profile.compile)
+    return profile
+
+
+def apply_cpu_profile(model: Any, profile: str | CpuProfile, num_threads: int | None = None) -> Any:
+    """Cast / quantize / compile a CPU model according to the profile and return the model to use."""
+    profile = resolve_cpu_profile(profile, num_threads)
+    if profile.num_threads is not None:
+        torch.set_num_threads(profile.num_threads)
+    model = model.to(device="cpu", dtype=profile.dtype).eval()
+    if profile.quantize_int8:
+        # inplace: 모델 전체 deepcopy 로 메모리가 두 배가 되는 것을 방지
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    if profile.compile:
+        model.forward = torch.compile(model.forward)
+    logger.info(
+        "Applied CPU profile %s (dtype=%s, int8=%s, threads=%s, compile=%s)",
+        profile.name,
+        profile.dtype,
+        profile.quantize_int8,
+        torch.get_num_threads(),
+        profile.compile,
+    )
+    return model
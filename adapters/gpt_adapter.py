@@ -1,17 +1,18 @@
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
-import torch
 from langchain_core.callbacks.manager import CallbackManagerForLLMRun
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.outputs import ChatGeneration, ChatResult
 from pydantic import Field
 
+if TYPE_CHECKING:
+    import torch
+
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 class OllamaAdapter(BaseChatModel):
@@ -74,6 +75,9 @@ class OllamaAdapter(BaseChatModel):
         return result
 
     def auto_define_device(self) -> str:
+        # Ollama 경로는 torch 가 필요 없으므로 호출 시점에만 import
+        import torch
+
         if torch.cuda.is_available():
             device = "cuda:0"
         elif torch.backends.mps.is_available():
@@ -82,13 +86,19 @@ class OllamaAdapter(BaseChatModel):
             device = "cpu"
         return device
 
-    def auto_define_dtype(self) -> torch.dtype:
+    def auto_define_dtype(self) -> "torch.dtype":
+        import torch
+
+        from adapters.cpu_profile import cpu_supports_bf16
+
         if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 8:
             return torch.bfloat16
         elif torch.backends.mps.is_available() or (
             torch.cuda.is_available() and torch.cuda.get_device_capability()[0] <= 7
         ):
             return torch.float16
+        elif cpu_supports_bf16():
+            return torch.bfloat16
         else:
             return torch.float32
 
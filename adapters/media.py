@@ -0,0 +1,101 @@
+"""
+Media loading for multimodal adapters: decode/resize images and audio off the calling thread
+and cache results by content hash.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+def _read_bytes(src: Any) -> bytes | None:
+    if isinstance(src, (str, Path)):
+        return Path(src).read_bytes()
+    if isinstance(src, (bytes, bytearray)):
+        return bytes(src)
+    return None
+
+
+def content_hash(data: bytes, *extra: Any) -> str:
+    h = hashlib.blake2b(data, digest_size=16)
+    for e in extra:
+        h.update(repr(e).encode("utf-8"))
+    return h.hexdigest()
+
+
+class MediaCache:
+    """Thread-safe LRU of decoded media keyed by content hash."""
+
+    def __init__(self, max_items: int = 1024):
+        self.max_items = max_items
+        self._items: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+
+def load_image(src: Any, cache: MediaCache | None = None, max_size: int | None = None):
+    """
+    Returns an RGB PIL image from a path, raw bytes or PIL image.
+    The longer side is downscaled to `max_size` when given.
+    """
+    from PIL import Image
+
+    data = _read_bytes(src)
+    key = content_hash(data, "image", max_size) if data is not None and cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    if data is None and not isinstance(src, Image.Image):
+        raise TypeError(f"Unsupported image source: {type(src).__name__}")
+    image = Image.open(io.BytesIO(data)) if data is not None else src
+    image = image.convert("RGB")
+    if max_size is not None and max(image.size) > max_size:
+        image.thumbnail((max_size, max_size))
+
+    if key is not None:
+        cache.put(key, image)
+    return image
+
+
+def load_audio(src: Any, cache: MediaCache | None = None):
+    """Returns an (array, sample_rate) tuple from a path, raw bytes or an existing tuple."""
+    import soundfile as sf
+
+    if isinstance(src, tuple):
+        return src
+    data = _read_bytes(src)
+    if data is None:
+        raise TypeError(f"Unsupported audio source: {type(src).__name__}")
+    key = content_hash(data, "audio") if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    audio = sf.read(io.BytesIO(data))
+
+    if key is not None:
+        cache.put(key, audio)
+    return audio
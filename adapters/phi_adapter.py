@@ -1,37 +1,90 @@
 import logging
 import re
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
-import torch
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from adapters.assisted import DecodingMonitor, DecodingStats, count_new_tokens, with_draft_model
+from adapters.media import MediaCache, load_audio, load_image
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 class Phi4Adapter:
-    def __init__(self, model, processor, generation_config, generate_kwargs: dict = {}, **kwargs):
+    def __init__(
+        self,
+        model,
+        processor,
+        generation_config,
+        generate_kwargs: dict = {},
+        draft_model=None,
+        num_assistant_tokens: int | None = None,
+        max_workers: int = 4,
+        image_max_size: int | None = None,
+        media_cache_size: int = 1024,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.model = model
         self.processor = processor
         self.generation_config = generation_config
-        self.generate_kwargs = generate_kwargs
+        # draft_model 지정 시 assisted(speculative) decoding
+        self.generate_kwargs = with_draft_model(generate_kwargs, draft_model, num_assistant_tokens)
+        self.last_decoding_stats = DecodingStats()
+        # 배치 처리용 미디어 디코딩 스레드 수 / 이미지 최대 변 길이 / 콘텐츠 해시 캐시
+        self.max_workers = max_workers
+        self.image_max_size = image_max_size
+        self.media_cache = MediaCache(media_cache_size)
 
     def __call__(self, messages, images=[], audios=[]) -> Any:
         return self.invoke(messages, images, audios)
 
     def invoke(self, messages, images=[], audios=[]):
         inputs = self.process(messages, images, audios)
-        with torch.no_grad():
-            outputs = self.model.generate(**inputs, **self.generate_kwargs, generation_config=self.generation_config)
+        return self.generate(inputs)[0]
+
+    def invoke_batch(self, conversations: list, images: list[list] | None = None, audios: list[list] | None = None):
+        """
+        Runs many conversations through a single left-padded `generate` call and returns every response.
+        `images[i]` / `audios[i]` are the media of conversation i (paths, bytes, PIL images or (array, sr) tuples).
+        """
+        images = images or [[] for _ in conversations]
+        audios = audios or [[] for _ in conversations]
+        if not (len(images) == len(audios) == len(conversations)):
+            raise ValueError("images and audios must have one entry per conversation")
+        inputs = self.process_batch(conversations, images, audios)
+        return self.generate(inputs)
+
+    def generate(self, inputs) -> list[str]:
+        # 프롬프트 구성만 쓰는 경우 torch 를 불러오지 않도록 생성 시점에 import
+        import torch
+
+        generate_kwargs = self.generate_kwargs
+        batch_size = inputs["input_ids"].shape[0]
+        if batch_size > 1 and generate_kwargs.get("assistant_model") is not None:
+            # transformers assisted decoding 은 batch size 1 만 지원 → 배치에서는 일반 디코딩
+            logger.info("Batch of %d: assisted decoding disabled, using regular decoding", batch_size)
+            generate_kwargs = {k: v for k, v in generate_kwargs.items() if k != "assistant_model"}
+        elif generate_kwargs.get("assistant_model") is not None:
+            logger.info("Single input: using assisted decoding")
+
+        with torch.no_grad(), DecodingMonitor(self.model, generate_kwargs.get("assistant_model")) as monitor:
+            outputs = self.model.generate(**inputs, **generate_kwargs, generation_config=self.generation_config)
 
         generate_ids = outputs[:, inputs["input_ids"].shape[1] :]
-        response = self.processor.batch_decode(
+        eos_token_id = getattr(self.generation_config, "eos_token_id", None)
+        if eos_token_id is None:
+            eos_token_id = self.processor.tokenizer.eos_token_id
+        monitor.stats.new_tokens = count_new_tokens(generate_ids, eos_token_id)
+        self.last_decoding_stats = monitor.stats
+        logger.info("Decoding stats: %s", monitor.stats.as_dict())
+        return self.processor.batch_decode(
             generate_ids,
             skip_special_tokens=True,
             clean_up_tokenization_spaces=False,
-        )[0]
-        return response
+        )
 
     def process(self, messages, images, audios):
         if not isinstance(messages[0], dict):
@@ -42,6 +95,35 @@ class Phi4Adapter:
         inputs = self.processor(template_prompt, images=images, audios=audios, return_tensors="pt")
         return inputs
 
+    def process_batch(self, conversations: list, images: list[list], audios: list[list]):
+        prompts = [
+            self.apply_chat_template(m if isinstance(m[0], dict) else self.convert_to_dict_messages(m))
+            for m in conversations
+        ]
+        flat_images = [img for per_conv in images for img in per_conv]
+        flat_audios = [aud for per_conv in audios for aud in per_conv]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            image_futures = [pool.submit(load_image, i, self.media_cache, self.image_max_size) for i in flat_images]
+            audio_futures = [pool.submit(load_audio, a, self.media_cache) for a in flat_audios]
+            loaded_images = [f.result() for f in image_futures]
+            loaded_audios = [f.result() for f in audio_futures]
+
+        # 생성 시작 위치를 맞추기 위해 왼쪽 패딩
+        tokenizer = self.processor.tokenizer
+        padding_side = tokenizer.padding_side
+        tokenizer.padding_side = "left"
+        try:
+            inputs = self.processor(
+                prompts,
+                images=loaded_images or None,
+                audios=loaded_audios or None,
+                padding=True,
+                return_tensors="pt",
+            )
+        finally:
+            tokenizer.padding_side = padding_side
+        return inputs
+
     def recognize_image_index(self, prompt) -> int:
         """
         Recognizes the index of the image in the prompt.
@@ -92,7 +174,9 @@ class Phi4Adapter:
         """
         return "<|end|>"
 
-    def convert_to_dict_messages(self, prompts: list[BaseMessage]) -> list[dict[str, str]]:
+    def convert_to_dict_messages(self, prompts: list["BaseMessage"]) -> list[dict[str, str]]:
+        from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
         result = []
         for prompt in prompts:
             if isinstance(prompt, SystemMessage):
@@ -108,18 +192,10 @@ class Phi4Adapter:
         return result
 
     def apply_chat_template(self, messages: list[dict[str, Any]]):
-        result = ""
+        parts = []
         for message in messages:
             role = message.get("role", "unknown")
             content = message.get("content", "")
-            if role == "system":
-                result += f"<|system|>{content}<|end|>"
-            elif role == "user":
-                result += f"<|user|>{content}<|end|>"
-            elif role == "assistant":
-                result += f"<|assistant|>{content}<|end|>"
-            else:
-                result += f"<|{role}|>{content}<|end|>"
-
-        result += "<|assistant|>"
-        return result
+            parts.append(f"<|{role}|>{content}<|end|>")
+        parts.append("<|assistant|>")
+        return "".join(parts)
@@ -0,0 +1,43 @@
+"""
+Name → adapter class registry.
+
+Backends are stored as "module:attribute" strings and imported only when resolved, so picking the Ollama path
+never imports torch/transformers.
+"""
+
+import importlib
+from typing import Any
+
+ADAPTERS: dict[str, str] = {
+    "ollama": "adapters.gpt_adapter:OllamaAdapter",
+    "transformers": "adapters.sllm_adapter:TransformersLangChainAdapter",
+    "phi4": "adapters.phi_adapter:Phi4Adapter",
+}
+
+_resolved: dict[str, type] = {}
+
+
+def register_adapter(name: str, target: str) -> None:
+    """Register (or override) a backend as "module:attribute"."""
+    ADAPTERS[name] = target
+    _resolved.pop(name, None)
+
+
+def available_adapters() -> list[str]:
+    return sorted(ADAPTERS)
+
+
+def get_adapter_class(name: str) -> type:
+    if name in _resolved:
+        return _resolved[name]
+    if name not in ADAPTERS:
+        raise ValueError(f"Unknown adapter: {name!r} (available: {', '.join(available_adapters())})")
+    module_name, attr = ADAPTERS[name].split(":")
+    cls = getattr(importlib.import_module(module_name), attr)
+    _resolved[name] = cls
+    return cls
+
+
+def create_adapter(name: str, *args, **kwargs) -> Any:
+    """Import the backend on first use and instantiate it."""
+    return get_adapter_class(name)(*args, **kwargs)
@@ -8,9 +8,14 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.outputs import ChatGeneration, ChatResult
 from pydantic import Field
+from transformers import LogitsProcessorList, StoppingCriteriaList, StopStringCriteria
+
+from adapters.answer_text import truncate_after_json, truncate_at_stop
+from adapters.assisted import DecodingMonitor, with_draft_model
+from adapters.cpu_profile import CpuProfile, apply_cpu_profile, cpu_supports_bf16
+from adapters.stopping import THINK_END_TOKEN_ID, JsonCompleteCriteria, ThinkGatedCriteria, ThinkingBudgetProcessor
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 
 class TransformersLangChainAdapter(BaseChatModel):
@@ -19,6 +24,9 @@ class TransformersLangChainAdapter(BaseChatModel):
     model_kwargs: dict = {}
     generate_kwargs: dict = {}
     device: str = ""
+    thinking_budget: int | None = None
+    stop_on_json: bool = False
+    think_end_token_id: int = THINK_END_TOKEN_ID
     # is_chatmodel: bool = False
 
     def __init__(
@@ -29,15 +37,34 @@ class TransformersLangChainAdapter(BaseChatModel):
         generate_kwargs: dict = {},
         # is_chatmodel: bool = False,
         device: str = "",
+        thinking_budget: int | None = None,
+        stop_on_json: bool = False,
+        think_end_token_id: int = THINK_END_TOKEN_ID,
+        draft_model: Any = None,
+        num_assistant_tokens: int | None = None,
+        cpu_profile: str | CpuProfile | None = None,
+        num_threads: int | None = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.model = model
         self.tokenizer = tokenizer
         self.model_kwargs = model_kwargs
-        self.generate_kwargs = generate_kwargs
+        # draft_model 지정 시 assisted(speculative) decoding: 작은 동일 계열 모델이 제안, 본 모델이 일괄 검증
+        self.generate_kwargs = with_draft_model(generate_kwargs, draft_model, num_assistant_tokens)
         # self.is_chatmodel = is_chatmodel
         self.device = device or self.auto_define_device()
+        self.thinking_budget = thinking_budget
+        self.stop_on_json = stop_on_json
+        self.think_end_token_id = think_end_token_id
+        if cpu_profile is not None and self.device != "cpu":
+            logger.warning("cpu_profile=%s ignored: device is %s, not cpu", cpu_profile, self.device)
+        elif cpu_profile is not None:
+            # fp32/bf16/int8 CPU 추론 프로필 적용(draft 모델 포함)
+            self.model = apply_cpu_profile(self.model, cpu_profile, num_threads)
+            if self.generate_kwargs.get("assistant_model") is not None:
+                draft = apply_cpu_profile(self.generate_kwargs["assistant_model"], cpu_profile, num_threads)
+                self.generate_kwargs = {**self.generate_kwargs, "assistant_model": draft}
 
     @property
     def _llm_type(self) -> str:
@@ -56,21 +83,64 @@ class TransformersLangChainAdapter(BaseChatModel):
         if "pad_token_id" not in self.generate_kwargs:
             self.generate_kwargs["pad_token_id"] = self.tokenizer.pad_token_id
 
-        with torch.no_grad():
-            outputs = self.model.generate(**chat_input, **self.generate_kwargs)
+        generate_kwargs = self.build_generation_controls(chat_input, stop, kwargs.get("enable_thinking", False))
+        with torch.no_grad(), DecodingMonitor(self.model, generate_kwargs.get("assistant_model")) as monitor:
+            outputs = self.model.generate(**chat_input, **generate_kwargs)
         output_ids = outputs[0][len(chat_input.input_ids[0]) :].tolist()
+        monitor.stats.new_tokens = len(output_ids)
+        logger.info("Decoding stats: %s", monitor.stats.as_dict())
         try:
-            # rindex finding 151668 (</think>)
-            index = len(output_ids) - output_ids[::-1].index(151668)
+            # rindex finding </think>
+            index = len(output_ids) - output_ids[::-1].index(self.think_end_token_id)
         except ValueError:
             index = 0
 
         # full_response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         thinking_content = self.tokenizer.decode(output_ids[:index], skip_special_tokens=True).strip("\n")
         content = self.tokenizer.decode(output_ids[index:], skip_special_tokens=True).strip("\n")
+        content = truncate_at_stop(content, stop)
+        if self.stop_on_json:
+            # 닫는 중괄호와 같은 토큰/같은 스텝에 수락된 뒤쪽 텍스트 제거
+            content = truncate_after_json(content)
 
         generation = ChatGeneration(message=AIMessage(content=content))
-        return ChatResult(generations=[generation], llm_output={"thinking_content": thinking_content})
+        return ChatResult(
+            generations=[generation],
+            llm_output={"thinking_content": thinking_content, "decoding_stats": monitor.stats.as_dict()},
+        )
+
+    def build_generation_controls(self, chat_input, stop: list[str] | None, enable_thinking: bool) -> dict:
+        """Merge thinking budget, stop sequences and JSON-complete stopping into a copy of generate_kwargs."""
+        generate_kwargs = dict(self.generate_kwargs)
+        prompt_length = chat_input.input_ids.shape[1]
+        logits_processor = LogitsProcessorList(generate_kwargs.pop("logits_processor", None) or [])
+        stopping_criteria = StoppingCriteriaList(generate_kwargs.pop("stopping_criteria", None) or [])
+
+        if enable_thinking and self.thinking_budget is not None:
+            logits_processor.append(
+                ThinkingBudgetProcessor(prompt_length, self.thinking_budget, self.think_end_token_id)
+            )
+        if stop:
+            stop_criteria = StopStringCriteria(tokenizer=self.tokenizer, stop_strings=stop)
+            if enable_thinking:
+                # 추론 블록 안의 stop 문자열로 </think> 전에 끊기지 않도록 답변 구간에서만 적용
+                stop_criteria = ThinkGatedCriteria(stop_criteria, prompt_length, self.think_end_token_id)
+            stopping_criteria.append(stop_criteria)
+        if self.stop_on_json:
+            stopping_criteria.append(
+                JsonCompleteCriteria(
+                    self.tokenizer,
+                    prompt_length,
+                    in_answer=not enable_thinking,
+                    think_end_token_id=self.think_end_token_id,
+                )
+            )
+
+        if logits_processor:
+            generate_kwargs["logits_processor"] = logits_processor
+        if stopping_criteria:
+            generate_kwargs["stopping_criteria"] = stopping_criteria
+        return generate_kwargs
 
     def tokenize(self, messages: list[BaseMessage] | list[dict[str, Any]], **kwargs):
         if not isinstance(messages[0], dict):
@@ -125,6 +195,8 @@ class TransformersLangChainAdapter(BaseChatModel):
             torch.cuda.is_available() and torch.cuda.get_device_capability()[0] <= 7
         ):
             return torch.float16
+        elif cpu_supports_bf16():
+            return torch.bfloat16
         else:
             return torch.float32
 
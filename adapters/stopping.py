@@ -0,0 +1,91 @@
+import torch
+from transformers import LogitsProcessor, StoppingCriteria
+
+from adapters.answer_text import json_scan_state, scan_json
+
+# Qwen3 계열 </think> 토큰 ID
+THINK_END_TOKEN_ID = 151668
+
+
+class ThinkingBudgetProcessor(LogitsProcessor):
+    """
+    Forces the think-end token once a row has spent `budget` tokens without closing its thinking block.
+    Keeps no state between calls: assisted decoding replaces rejected draft tokens in place and runs the same
+    processor inside the draft's generate, so the whole generated span is re-checked every step.
+    """
+
+    def __init__(self, prompt_length: int, budget: int, think_end_token_id: int = THINK_END_TOKEN_ID):
+        self.prompt_length = prompt_length
+        self.budget = budget
+        self.think_end_token_id = think_end_token_id
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        if input_ids.shape[1] - self.prompt_length < self.budget:
+            return scores
+        closed = (input_ids[:, self.prompt_length :] == self.think_end_token_id).any(dim=1)
+        force = ~closed
+        if force.any():
+            scores[force] = -float("inf")
+            scores[force, self.think_end_token_id] = 0.0
+        return scores
+
+
+class JsonCompleteCriteria(StoppingCriteria):
+    """
+    Stops a row as soon as the first top-level JSON object in its answer is balanced and closed.
+    Braces inside string literals are ignored. When `in_answer` is False, scanning starts after the think-end token.
+    """
+
+    def __init__(
+        self,
+        tokenizer,
+        prompt_length: int,
+        in_answer: bool = True,
+        think_end_token_id: int = THINK_END_TOKEN_ID,
+    ):
+        self.tokenizer = tokenizer
+        self.prompt_length = prompt_length
+        self.in_answer = in_answer
+        self.think_end_token_id = think_end_token_id
+        self._rows: list[dict] = []
+
+    def _reset(self) -> dict:
+        return {"checked": self.prompt_length, "in_answer": self.in_answer, **json_scan_state()}
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        if not self._rows:
+            self._rows = [self._reset() for _ in range(input_ids.shape[0])]
+        cur_len = input_ids.shape[1]
+        result = []
+        for row, state in enumerate(self._rows):
+            if cur_len < state["checked"]:
+                state.update(self._reset())
+            if not state["done"]:
+                for token_id in input_ids[row, state["checked"] :].tolist():
+                    if not state["in_answer"]:
+                        state["in_answer"] = token_id == self.think_end_token_id
+                        continue
+                    scan_json(state, self.tokenizer.decode([token_id], skip_special_tokens=True))
+                    if state["done"]:
+                        break
+            state["checked"] = cur_len
+            result.append(state["done"])
+        return torch.tensor(result, dtype=torch.bool, device=input_ids.device)
+
+
+class ThinkGatedCriteria(StoppingCriteria):
+    """
+    Applies `inner` only to rows whose thinking block is already closed, so stop strings that happen to appear in
+    the reasoning do not end generation before the think-end token.
+    """
+
+    def __init__(self, inner: StoppingCriteria, prompt_length: int, think_end_token_id: int = THINK_END_TOKEN_ID):
+        self.inner = inner
+        self.prompt_length = prompt_length
+        self.think_end_token_id = think_end_token_id
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        in_answer = (input_ids[:, self.prompt_length :] == self.think_end_token_id).any(dim=1)
+        if not in_answer.any():
+            return in_answer
+        return self.inner(input_ids, scores, **kwargs) & in_answer
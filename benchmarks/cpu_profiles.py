@@ -0,0 +1,120 @@
+"""
+CPU inference profile benchmark for TransformersLangChainAdapter.
+
+Each profile runs in its own subprocess so peak RSS is measured independently:
+
+    python -m benchmarks.cpu_profiles --model Qwen/Qwen3-0.6B --profiles fp32 bf16 int8 --threads 8
+"""
+
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+
+PROMPT = '퀘스트 2개를 {"quests": [{"id": ..., "name": ..., "summary": ...}]} 형식의 JSON 으로만 작성해라.'
+
+
+def peak_rss_mb() -> float:
+    # Linux 에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss_mb() -> float:
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return peak_rss_mb()
+
+
+def run_single(model_name: str, profile: str, threads: int | None, max_new_tokens: int, repeat: int) -> dict:
+    import torch
+    from langchain_core.messages import HumanMessage
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    from adapters.cpu_profile import resolve_cpu_profile
+    from adapters.sllm_adapter import TransformersLangChainAdapter
+
+    # 프로필 dtype 으로 바로 로드(int8 은 fp32 가중치에서 양자화) → fp32 사본이 남지 않게 함
+    load_dtype = resolve_cpu_profile(profile).dtype
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForCausalLM.from_pretrained(model_name, torch_dtype=load_dtype)
+    adapter = TransformersLangChainAdapter(
+        model=model,
+        tokenizer=tokenizer,
+        generate_kwargs={"max_new_tokens": max_new_tokens, "do_sample": False},
+        device="cpu",
+        cpu_profile=profile,
+        num_threads=threads,
+    )
+    del model
+    gc.collect()
+    rss_after_load = current_rss_mb()
+
+    # 워밍업(oneDNN 커널 선택/compile 비용 제외)
+    adapter._generate([HumanMessage(content=PROMPT)])
+
+    new_tokens, elapsed = 0, 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = adapter._generate([HumanMessage(content=PROMPT)])
+        elapsed += time.perf_counter() - start
+        new_tokens += result.llm_output["decoding_stats"]["new_tokens"]
+    return {
+        "profile": profile,
+        "threads": torch.get_num_threads(),
+        "tokens_per_second": new_tokens / elapsed if elapsed else 0.0,
+        "rss_after_load_mb": rss_after_load,
+        "rss_after_generate_mb": current_rss_mb(),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="Qwen/Qwen3-0.6B")
+    parser.add_argument("--profiles", nargs="+", default=["fp32", "bf16", "int8"])
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--max-new-tokens", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--single", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        result = run_single(args.model, args.single, args.threads, args.max_new_tokens, args.repeat)
+        print(json.dumps(result))
+        return
+
+    for profile in args.profiles:
+        cmd = [
+            sys.executable,
+            "-m",
+            "benchmarks.cpu_profiles",
+            "--model",
+            args.model,
+            "--single",
+            profile,
+            "--max-new-tokens",
+            str(args.max_new_tokens),
+            "--repeat",
+            str(args.repeat),
+        ]
+        if args.threads is not None:
+            cmd += ["--threads", str(args.threads)]
+        proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{result['profile']:>5}: {result['tokens_per_second']:.2f} tok/s, "
+            f"RSS load {result['rss_after_load_mb']:.0f} MB / generate {result['rss_after_generate_mb']:.0f} MB "
+            f"(peak {result['peak_rss_mb']:.0f} MB), threads={result['threads']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
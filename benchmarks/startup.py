@@ -0,0 +1,44 @@
+"""
+Startup (import) time benchmark for adapter backends resolved through the registry.
+
+Each backend is resolved in a fresh interpreter so module caches don't hide import cost:
+
+    python -m benchmarks.startup --repeat 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+from adapters.registry import get_adapter_class
+get_adapter_class({name!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "torch_loaded": "torch" in sys.modules}}))
+"""
+
+
+def measure(name: str) -> dict:
+    proc = subprocess.run([sys.executable, "-c", SNIPPET.format(name=name)], capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    from adapters.registry import available_adapters
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=available_adapters())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name in args.backends:
+        runs = [measure(name) for _ in range(args.repeat)]
+        best = min(r["seconds"] for r in runs)
+        print(f"{name:>12}: {best * 1000:.0f} ms (best of {args.repeat}), torch loaded={runs[0]['torch_loaded']}")
+
+
+if __name__ == "__main__":
+    main()
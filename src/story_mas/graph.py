@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import List
 
 from langgraph.graph import END, StateGraph
 
@@ -12,7 +12,9 @@ from src.story_mas.schemas import (
     ScenarioDoc,
     Scene,
 )
+from src.story_mas.tools.canon_store import iter_canon
 from src.story_mas.tools.llm import gen_scenario_json
+from src.story_mas.tools.quest_graph import QuestGraph
 from src.story_mas.tools.retrieval import retrieve_canon
 
 
@@ -28,13 +30,19 @@ def supervisor(state: GraphState) -> GraphState:
                 state.instructions["must_use_glossary_min"] = 3
             if issue.type == "structure":
                 state.instructions["min_link_coverage"] = 0.9
+        # 퀘스트 그래프 이슈는 대상 ID 를 그대로 Writer 수정 지시로 전달
+        fixes = [f"{i.message}: {', '.join(i.refs)}" for i in state.eval.issues if i.type == "quest_graph"]
+        if fixes:
+            state.instructions["fix_quest_graph"] = fixes
+        else:
+            state.instructions.pop("fix_quest_graph", None)
     state.history.append("Supervisor: 지시 설정/업데이트")
     return state
 
 
 def scenario_writer(state: GraphState) -> GraphState:
     # RAG 근거(간단)
-    refs = retrieve_canon(state.bible.canon_docs, "도시 루멘 공명 길드 금지 유물 폐허 지하 봉인")
+    refs = retrieve_canon(iter_canon(state.bible), "도시 루멘 공명 길드 금지 유물 폐허 지하 봉인")
     draft = gen_scenario_json(
         bible={
             "title": state.bible.title,
@@ -83,14 +91,14 @@ def canon_qa(state: GraphState) -> GraphState:
             issues.append(EvalIssue(type="age", message="연령 등급 위반 가능"))
 
     # 장면-퀘스트 링크 커버리지
-    scene_ids: Set[str] = {s.id for act in state.scenario.outline.acts for s in act}
-    linked: Set[str] = set()
-    for q in state.scenario.quests:
-        linked.update(q.related_scenes)
-    coverage = len(linked & scene_ids) / max(1, len(scene_ids))
+    qg = QuestGraph.build(state.scenario)
+    coverage = len(qg.linked_scenes) / max(1, len(qg.scene_ids))
     if coverage < 0.8:
         issues.append(EvalIssue(type="structure", message="장면-퀘스트 링크 부족", refs=[f"coverage={coverage:.2f}"]))
 
+    # 퀘스트 그래프 구조: 선행 순환/도달 불가/끊어진 참조/고립 장면
+    issues.extend(qg.issues())
+
     # 설정 위반(간단): 세계관 핵심 키워드 최소 1개 이상 등장
     canon_keywords = ["루멘", "콘서트마스터", "에코 코어"]
     corpus = " ".join([d.text for d in dlg] + [q.summary for q in state.scenario.quests])
@@ -104,6 +112,7 @@ def canon_qa(state: GraphState) -> GraphState:
         metrics={
             "glossary_hit_rate": hit_rate,
             "link_coverage": coverage,
+            "dangling_refs": float(len(qg.dangling_prereqs) + len(qg.dangling_scenes) + len(qg.dangling_dialogues)),
             "canon_violations": 1.0 if any(i.type == "canon" for i in issues) else 0.0,
         },
     )
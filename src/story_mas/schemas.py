@@ -1,9 +1,17 @@
 from pydantic import BaseModel
 
 
+class CanonStoreRef(BaseModel):
+    path: str
+    content_hash: str
+    num_chunks: int
+
+
 class WorldBible(BaseModel):
     title: str
-    canon_docs: list[str]
+    canon_docs: list[str] = []
+    # 대용량 설정집: 청크는 디스크(mmap)에 두고 참조/해시만 상태에 보관
+    canon_store: CanonStoreRef | None = None
     glossary: dict[str, str]
     style_guide: dict[str, object]  # tone, age, forbidden(list), etc.
 
@@ -0,0 +1,200 @@
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+
+from src.story_mas.schemas import CanonStoreRef, WorldBible
+
+# 인덱스 레코드: (offset, length) little-endian uint64 쌍 + 해당 청크까지의 체인 해시(16바이트)
+_INDEX = struct.Struct("<QQ16s")
+
+
+class CanonStore:
+    """
+    Append-only on-disk canon chunk store.
+
+    <dir>/canon.bin  UTF-8 chunk bytes back to back
+    <dir>/canon.idx  fixed-size (offset, length, chained hash) records, chunk ID = record position
+    <dir>/canon.json chunk count and chained content hash (the commit point)
+    <dir>/canon.lock flock target serializing writers across processes
+
+    Reads go through mmap, so only touched pages are loaded and they are shared between processes via the page cache.
+    Because every record carries the chained hash up to itself, a ref taken before later appends stays verifiable.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._data_path = self.path / "canon.bin"
+        self._index_path = self.path / "canon.idx"
+        self._meta_path = self.path / "canon.json"
+        self._lock_path = self.path / "canon.lock"
+        for p in (self._data_path, self._index_path, self._lock_path):
+            p.touch(exist_ok=True)
+        self._data_mm: mmap.mmap | bytes | None = None
+        self._index_mm: mmap.mmap | None = None
+        # open_store 핸들은 스레드 간 공유 → mmap 교체(refresh)와 읽기(get)를 직렬화
+        self._lock = threading.RLock()
+        self._load_meta()
+
+    def _load_meta(self) -> None:
+        # canon.json 이 커밋 지점: 여기 기록된 count 까지만 유효한 청크로 취급
+        meta = json.loads(self._meta_path.read_text("utf-8")) if self._meta_path.exists() else {}
+        self._count = meta.get("count", 0)
+        self._hash = meta.get("hash", "")
+        if self._index_path.stat().st_size < self._count * _INDEX.size:
+            raise ValueError(f"canon store {self.path} is corrupt: index shorter than {self._count} records")
+
+    def refresh(self) -> None:
+        """Re-reads canon.json so appends made through another handle become visible."""
+        with self._lock:
+            self._close_maps()
+            self._load_meta()
+
+    def _truncate_uncommitted(self) -> None:
+        """Drops records written after the last canon.json commit (e.g. a crash between fsync and meta replace)."""
+        index_size = self._count * _INDEX.size
+        if self._count:
+            with open(self._index_path, "rb") as index:
+                index.seek(index_size - _INDEX.size)
+                offset, length, _ = _INDEX.unpack(index.read(_INDEX.size))
+            data_size = offset + length
+        else:
+            data_size = 0
+        for p, size in ((self._index_path, index_size), (self._data_path, data_size)):
+            if p.stat().st_size > size:
+                os.truncate(p, size)
+
+    @classmethod
+    def build(cls, path: str | Path, docs: Iterable[str]) -> "CanonStore":
+        store = cls(path)
+        store.extend(docs)
+        return store
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def content_hash(self) -> str:
+        return self._hash
+
+    def ref(self) -> CanonStoreRef:
+        return CanonStoreRef(path=str(self.path), content_hash=self._hash, num_chunks=self._count)
+
+    def extend(self, docs: Iterable[str]) -> list[int]:
+        # refresh → 미커밋 정리 → append → canon.json 교체 전체를 파일 락으로 묶어
+        # 다른 프로세스의 진행 중인 append 를 자르거나 오프셋이 엇갈리지 않게 함
+        with self._lock, open(self._lock_path, "rb") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                self.refresh()
+                self._truncate_uncommitted()
+                return self._append_locked(docs)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _append_locked(self, docs: Iterable[str]) -> list[int]:
+        ids = []
+        with open(self._data_path, "ab") as data, open(self._index_path, "ab") as index:
+            offset = data.tell()
+            for doc in docs:
+                raw = doc.encode("utf-8")
+                # 이전 해시에 레코드를 이어 붙이는 체인 해시 → 전체 재해시 없이 갱신
+                digest = hashlib.blake2b(self._hash.encode("ascii") + raw, digest_size=16).digest()
+                data.write(raw)
+                index.write(_INDEX.pack(offset, len(raw), digest))
+                self._hash = digest.hex()
+                ids.append(self._count)
+                self._count += 1
+                offset += len(raw)
+            data.flush()
+            index.flush()
+            os.fsync(data.fileno())
+            os.fsync(index.fileno())
+        tmp = self._meta_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"count": self._count, "hash": self._hash}), "utf-8")
+        os.replace(tmp, self._meta_path)
+        return ids
+
+    def append(self, doc: str) -> int:
+        return self.extend([doc])[0]
+
+    def get(self, chunk_id: int) -> str:
+        with self._lock:
+            if not 0 <= chunk_id < self._count:
+                raise IndexError(f"canon chunk {chunk_id} out of range (0..{self._count - 1})")
+            data_mm, index_mm = self._maps()
+            offset, length, _ = _INDEX.unpack_from(index_mm, chunk_id * _INDEX.size)
+            return data_mm[offset : offset + length].decode("utf-8")
+
+    def hash_at(self, num_chunks: int) -> str:
+        """Chained content hash of the first `num_chunks` chunks (what `ref()` reported at that size)."""
+        with self._lock:
+            if not 0 <= num_chunks <= self._count:
+                raise IndexError(f"canon store has {self._count} chunks, not {num_chunks}")
+            if num_chunks == 0:
+                return ""
+            _, index_mm = self._maps()
+            return _INDEX.unpack_from(index_mm, (num_chunks - 1) * _INDEX.size)[2].hex()
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self.get(i)
+
+    def _maps(self) -> tuple[mmap.mmap | bytes, mmap.mmap]:
+        # 호출 측에서 self._lock 보유
+        if self._index_mm is None:
+            with open(self._data_path, "rb") as data, open(self._index_path, "rb") as index:
+                # 빈 파일은 mmap 불가(청크가 모두 빈 문자열인 경우) → 빈 bytes 로 대체
+                if os.fstat(data.fileno()).st_size:
+                    self._data_mm = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self._data_mm = b""
+                self._index_mm = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._data_mm, self._index_mm
+
+    def _close_maps(self) -> None:
+        for mm in (self._data_mm, self._index_mm):
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+        self._data_mm = self._index_mm = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_maps()
+
+
+@lru_cache(maxsize=None)
+def _open_store(path: str) -> CanonStore:
+    return CanonStore(path)
+
+
+def open_store(ref: CanonStoreRef) -> CanonStore:
+    """
+    Returns the process-wide store for `ref`, checking that its first `ref.num_chunks` chunks still match.
+    Chunks appended after the ref was taken do not invalidate it.
+    """
+    store = _open_store(ref.path)
+    if len(store) < ref.num_chunks:
+        # 캐시된 핸들 이후 다른 핸들/프로세스에서 append 된 경우
+        store.refresh()
+    if len(store) < ref.num_chunks or store.hash_at(ref.num_chunks) != ref.content_hash:
+        raise ValueError(f"canon store {ref.path} does not contain the referenced {ref.num_chunks} chunks")
+    return store
+
+
+def iter_canon(bible: WorldBible) -> Iterator[str]:
+    """Yields canon chunks lazily from the store when the bible references one, else from inline canon_docs."""
+    if bible.canon_store is None:
+        yield from bible.canon_docs
+        return
+    store = open_store(bible.canon_store)
+    # ref 시점의 청크까지만 → 이후 append 는 이 상태(체크포인트)에 영향 없음
+    for i in range(bible.canon_store.num_chunks):
+        yield store.get(i)
@@ -100,6 +100,8 @@ def gen_scenario_json(bible: Dict[str, Any], instructions: Dict[str, Any]) -> Di
             "용어집 키워드 최소 2개 이상 대사에 포함",
             "금칙어 금지, 연령 15 준수",
             "장면과 퀘스트는 서로 링크될 것(related_scenes)",
+            "prerequisites/related_scenes/scene_id 는 실제 존재하는 ID만 참조하고 선행 퀘스트 순환 금지",
+            "instructions.fix_quest_graph 가 있으면 나열된 참조/순환을 모두 수정",
             "오직 JSON만 출력",
         ],
     }
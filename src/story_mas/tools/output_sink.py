@@ -0,0 +1,196 @@
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from src.story_mas.schemas import EvalReport, GraphState, ScenarioDoc
+
+_STOP = object()
+
+
+def render_outline(scenario: ScenarioDoc) -> str:
+    lines = ["# Outline"]
+    for i, act in enumerate(scenario.outline.acts, 1):
+        lines.append(f"\n## Act {i}")
+        for s in act:
+            lines.append(f"- [{s.id}] {s.summary} @ {s.location} ({', '.join(s.characters)})")
+    return "\n".join(lines)
+
+
+def _state_fields(state: GraphState | dict) -> tuple[ScenarioDoc | None, EvalReport | None, list[str]]:
+    # app.invoke 는 dict 를, 노드 내부는 GraphState 를 다룸
+    if isinstance(state, dict):
+        return state.get("scenario"), state.get("eval"), state.get("history", [])
+    return state.scenario, state.eval, state.history
+
+
+def _snapshot(state: GraphState | dict) -> tuple[ScenarioDoc | None, EvalReport | None, list[str]]:
+    # 노드는 상태를 제자리에서 수정하므로 submit 시점의 내용을 복사해 둠
+    scenario, eval_report, history = _state_fields(state)
+    return (
+        scenario.model_copy(deep=True) if scenario is not None else None,
+        eval_report.model_copy(deep=True) if eval_report is not None else None,
+        list(history),
+    )
+
+
+class OutputSink:
+    """
+    Append-only run archive.
+
+    Each finished run is one gzip member appended to `<root>/shards/*.jsonl.gz`; `<root>/index.jsonl` maps
+    run_id → (shard, offset, length) so a single run can be read back without decompressing the shard.
+    `submit` deep-copies the run's scenario/eval/history so later in-place mutation of the state does not leak
+    into the archive; JSON encoding, compression and I/O happen on a background thread.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = "outputs/runs",
+        runs_per_shard: int = 1000,
+        render_markdown: bool = False,
+        max_pending: int = 256,
+    ):
+        self.root = Path(root)
+        self.shard_dir = self.root / "shards"
+        self.outline_dir = self.root / "outlines"
+        self.index_path = self.root / "index.jsonl"
+        self.runs_per_shard = runs_per_shard
+        self.render_markdown = render_markdown
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        if render_markdown:
+            self.outline_dir.mkdir(parents=True, exist_ok=True)
+
+        # 샤드 이름에 세션 시각/PID/난수를 넣어 이전 실행·동시 프로세스·같은 프로세스의 다른 sink 와 겹치지 않게 함
+        self._session = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._shard_no = 0
+        self._shard_runs = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._worker, name="OutputSink", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def submit(self, state: GraphState | dict, run_id: str | None = None) -> str:
+        """Snapshots a finished run, queues it for writing and returns its run ID."""
+        if self._closed:
+            raise RuntimeError("OutputSink is closed")
+        if self._error is not None:
+            raise RuntimeError("OutputSink writer failed") from self._error
+        run_id = run_id or uuid.uuid4().hex
+        self._queue.put((run_id, _snapshot(state)))
+        return run_id
+
+    def close(self) -> None:
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            raise RuntimeError("OutputSink writer failed") from self._error
+
+    def _shard_path(self) -> Path:
+        return self.shard_dir / f"runs-{self._session}-{self._shard_no:05d}.jsonl.gz"
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            try:
+                self._write(*item)
+            except Exception as e:
+                # submit/close 에서 호출 측에 다시 전달
+                self._error = e
+                return
+
+    def _write(self, run_id: str, snapshot: tuple[ScenarioDoc | None, EvalReport | None, list[str]]) -> None:
+        scenario, eval_report, history = snapshot
+        record = {
+            "run_id": run_id,
+            "scenario": scenario.model_dump(mode="json") if scenario is not None else None,
+            "eval": eval_report.model_dump(mode="json") if eval_report is not None else None,
+            "history": history,
+        }
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        member = gzip.compress(line.encode("utf-8"))
+
+        if self._shard_runs >= self.runs_per_shard:
+            self._shard_no += 1
+            self._shard_runs = 0
+        shard = self._shard_path()
+        with open(shard, "ab") as f:
+            offset = f.tell()
+            f.write(member)
+        self._shard_runs += 1
+
+        entry = {"run_id": run_id, "shard": shard.name, "offset": offset, "length": len(member)}
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        if self.render_markdown and scenario is not None:
+            (self.outline_dir / f"{run_id}.md").write_text(render_outline(scenario), encoding="utf-8")
+
+
+class RunArchive:
+    """
+    Random access to archived runs. The index is read once into a run_id → entry dict and only the lines appended
+    since the last read are parsed when a lookup misses.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._index_offset = 0
+        self._lock = threading.Lock()
+
+    def _load_new_entries(self) -> None:
+        index_path = self.root / "index.jsonl"
+        if not index_path.exists():
+            return
+        with open(index_path, "rb") as f:
+            f.seek(self._index_offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # 다른 writer 가 쓰는 중인 마지막 줄은 다음 조회 때 다시 읽음
+                    break
+                e = json.loads(raw)
+                self._entries[e["run_id"]] = e  # 같은 run_id 는 마지막 항목 우선
+                self._index_offset += len(raw)
+
+    def entry(self, run_id: str) -> dict[str, Any]:
+        with self._lock:
+            if run_id not in self._entries:
+                self._load_new_entries()
+            if run_id not in self._entries:
+                raise KeyError(run_id)
+            return self._entries[run_id]
+
+    def load(self, run_id: str) -> dict[str, Any]:
+        entry = self.entry(run_id)
+        with open(self.root / "shards" / entry["shard"], "rb") as f:
+            f.seek(entry["offset"])
+            member = f.read(entry["length"])
+        return json.loads(gzip.decompress(member))
+
+
+@lru_cache(maxsize=None)
+def _archive(root: str) -> RunArchive:
+    return RunArchive(root)
+
+
+def load_run(root: str | Path, run_id: str) -> dict[str, Any]:
+    """Reads one archived run by ID through a per-root cached index."""
+    return _archive(str(Path(root))).load(run_id)
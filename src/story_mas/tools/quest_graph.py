@@ -0,0 +1,150 @@
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.story_mas.schemas import EvalIssue, ScenarioDoc
+
+
+@dataclass
+class QuestGraph:
+    """시나리오 1건의 퀘스트/장면/대사 참조를 한 번에 인덱싱한 구조 그래프."""
+
+    quest_ids: list[str] = field(default_factory=list)
+    scene_ids: list[str] = field(default_factory=list)
+    # 퀘스트 → 선행 퀘스트(존재하는 것만), 선행 퀘스트 → 후행 퀘스트
+    prereqs: dict[str, list[str]] = field(default_factory=dict)
+    dependents: dict[str, list[str]] = field(default_factory=dict)
+    # 장면 → 링크한 퀘스트 / 대사 수
+    scene_quests: dict[str, list[str]] = field(default_factory=dict)
+    scene_lines: dict[str, int] = field(default_factory=dict)
+    # (출처, 대상) 형태의 끊어진 참조
+    dangling_prereqs: list[tuple[str, str]] = field(default_factory=list)
+    dangling_scenes: list[tuple[str, str]] = field(default_factory=list)
+    dangling_dialogues: list[tuple[int, str]] = field(default_factory=list)
+    duplicate_quests: list[str] = field(default_factory=list)
+    duplicate_scenes: list[str] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, scenario: ScenarioDoc) -> "QuestGraph":
+        g = cls()
+        for act in scenario.outline.acts:
+            for s in act:
+                if s.id in g.scene_quests:
+                    g.duplicate_scenes.append(s.id)
+                    continue
+                g.scene_ids.append(s.id)
+                g.scene_quests[s.id] = []
+                g.scene_lines[s.id] = 0
+
+        for q in scenario.quests:
+            if q.id in g.prereqs:
+                g.duplicate_quests.append(q.id)
+                continue
+            g.quest_ids.append(q.id)
+            g.prereqs[q.id] = []
+            g.dependents[q.id] = []
+
+        seen_quests: set[str] = set()
+        for q in scenario.quests:
+            if q.id in seen_quests:
+                continue
+            seen_quests.add(q.id)
+            for p in q.prerequisites:
+                if p in g.dependents:
+                    g.prereqs[q.id].append(p)
+                    g.dependents[p].append(q.id)
+                else:
+                    g.dangling_prereqs.append((q.id, p))
+            for sid in q.related_scenes:
+                if sid in g.scene_quests:
+                    g.scene_quests[sid].append(q.id)
+                else:
+                    g.dangling_scenes.append((q.id, sid))
+
+        for i, d in enumerate(scenario.dialogues):
+            if d.scene_id in g.scene_lines:
+                g.scene_lines[d.scene_id] += 1
+            else:
+                g.dangling_dialogues.append((i, d.scene_id))
+        return g
+
+    @property
+    def linked_scenes(self) -> set[str]:
+        return {sid for sid, qs in self.scene_quests.items() if qs}
+
+    def reachable_quests(self) -> set[str]:
+        """선행 조건이 모두 충족 가능한 퀘스트(Kahn 위상 정렬, O(V+E))."""
+        # 끊어진 선행 조건이 있는 퀘스트는 시작 불가로 취급
+        blocked = {qid for qid, _ in self.dangling_prereqs}
+        indegree = {qid: len(ps) for qid, ps in self.prereqs.items()}
+        queue = deque(qid for qid in self.quest_ids if indegree[qid] == 0 and qid not in blocked)
+        reached: set[str] = set()
+        while queue:
+            qid = queue.popleft()
+            reached.add(qid)
+            for nxt in self.dependents[qid]:
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0 and nxt not in blocked:
+                    queue.append(nxt)
+        return reached
+
+    def prerequisite_cycles(self) -> list[list[str]]:
+        """선행 조건 순환을 찾는다(반복 DFS 3색 표시, O(V+E))."""
+        white, gray, black = 0, 1, 2
+        color = dict.fromkeys(self.quest_ids, white)
+        cycles: list[list[str]] = []
+        for root in self.quest_ids:
+            if color[root] != white:
+                continue
+            path: list[str] = [root]
+            pos = {root: 0}
+            stack = [(root, iter(self.prereqs[root]))]
+            color[root] = gray
+            while stack:
+                node, it = stack[-1]
+                nxt = next(it, None)
+                if nxt is None:
+                    color[node] = black
+                    stack.pop()
+                    del pos[path.pop()]
+                elif color[nxt] == white:
+                    color[nxt] = gray
+                    pos[nxt] = len(path)
+                    path.append(nxt)
+                    stack.append((nxt, iter(self.prereqs[nxt])))
+                elif color[nxt] == gray:
+                    cycles.append(path[pos[nxt] :] + [nxt])
+        return cycles
+
+    def orphan_scenes(self) -> list[str]:
+        """퀘스트 링크도 대사도 없는 장면."""
+        return [sid for sid in self.scene_ids if not self.scene_quests[sid] and not self.scene_lines[sid]]
+
+    def issues(self) -> list[EvalIssue]:
+        # 점수 산정이 이슈 개수 기반이므로 유형별로 1건씩 묶고 대상은 refs 로 나열
+        issues: list[EvalIssue] = []
+        if self.duplicate_quests or self.duplicate_scenes:
+            refs = [f"quest:{q}" for q in self.duplicate_quests] + [f"scene:{s}" for s in self.duplicate_scenes]
+            issues.append(EvalIssue(type="quest_graph", message="중복 ID", refs=refs))
+        if self.dangling_prereqs:
+            refs = [f"{q}->quest:{p}" for q, p in self.dangling_prereqs]
+            issues.append(EvalIssue(type="quest_graph", message="존재하지 않는 선행 퀘스트 참조", refs=refs))
+        if self.dangling_scenes:
+            refs = [f"{q}->scene:{s}" for q, s in self.dangling_scenes]
+            issues.append(EvalIssue(type="quest_graph", message="존재하지 않는 장면 링크", refs=refs))
+        if self.dangling_dialogues:
+            refs = [f"dialogue[{i}]->scene:{s}" for i, s in self.dangling_dialogues]
+            issues.append(EvalIssue(type="quest_graph", message="대사의 장면 ID 불일치", refs=refs))
+        cycles = self.prerequisite_cycles()
+        if cycles:
+            refs = [" -> ".join(c) for c in cycles]
+            issues.append(EvalIssue(type="quest_graph", message="선행 퀘스트 순환", refs=refs))
+        # 순환 구성원/끊어진 선행 조건 퀘스트는 위 이슈에서 이미 보고 → 그 여파로 막힌 후행 퀘스트만 나열
+        root_causes = {qid for c in cycles for qid in c} | {qid for qid, _ in self.dangling_prereqs}
+        reached = self.reachable_quests()
+        unreachable = [qid for qid in self.quest_ids if qid not in reached and qid not in root_causes]
+        if unreachable:
+            issues.append(EvalIssue(type="quest_graph", message="도달 불가 퀘스트(선행 퀘스트 막힘)", refs=unreachable))
+        orphans = self.orphan_scenes()
+        if orphans:
+            issues.append(EvalIssue(type="quest_graph", message="고립 장면(퀘스트/대사 없음)", refs=orphans))
+        return issues
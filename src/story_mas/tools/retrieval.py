@@ -1,5 +1,10 @@
-def retrieve_canon(chunks: list[str], query: str, k: int = 5) -> list[str]:
+import heapq
+from collections.abc import Iterable
+
+
+def retrieve_canon(chunks: Iterable[str], query: str, k: int = 5) -> list[str]:
     # 간단 키워드 스코어링(실전에서는 임베딩 검색 권장)
+    # 청크를 하나씩 읽으며 상위 k개만 유지 → 저장소 전체를 메모리에 올리지 않음
     q = set(query.lower().split())
-    scored = [(c, sum(1 for w in c.lower().split() if w in q)) for c in chunks]
-    return [c for c, _ in sorted(scored, key=lambda x: x[1], reverse=True)[:k]]
+    scored = ((c, sum(1 for w in c.lower().split() if w in q)) for c in chunks)
+    return [c for c, _ in heapq.nlargest(k, scored, key=lambda x: x[1])]
@@ -1,9 +1,8 @@
-import json
-import os
 from pathlib import Path
 
 from src.story_mas.graph import app
 from src.story_mas.schemas import GraphState, WorldBible
+from src.story_mas.tools.output_sink import OutputSink, render_outline
 
 
 def default_bible() -> WorldBible:
@@ -40,51 +39,17 @@ def save_outputs(state):
     out_dir = Path("outputs")
     out_dir.mkdir(exist_ok=True, parents=True)
 
-    # 상태 접근 헬퍼: dict도, Pydantic 객체도 안전하게 처리
-    def get_field(obj, key, default=None):
-        return getattr(obj, key, obj.get(key, default) if isinstance(obj, dict) else default)
-
-    def to_dict(x):
-        try:
-            # Pydantic v2
-            from pydantic import BaseModel
-
-            if isinstance(x, BaseModel):
-                return x.model_dump()
-        except Exception:
-            pass
-        return x  # 이미 dict이면 그대로
-
-    scenario = state["scenario"] if isinstance(state, dict) else get_field(state, "scenario")
-    eval_report = state["eval"] if isinstance(state, dict) else get_field(state, "eval")
+    scenario = state["scenario"]
+    eval_report = state["eval"]
 
     # 1) scenario.json 저장
-    with open(out_dir / "scenario.json", "w", encoding="utf-8") as f:
-        json.dump(to_dict(scenario), f, ensure_ascii=False, indent=2)
+    (out_dir / "scenario.json").write_text(scenario.model_dump_json(indent=2), encoding="utf-8")
 
     # 2) eval_report.json 저장
-    with open(out_dir / "eval_report.json", "w", encoding="utf-8") as f:
-        json.dump(to_dict(eval_report), f, ensure_ascii=False, indent=2)
+    (out_dir / "eval_report.json").write_text(eval_report.model_dump_json(indent=2), encoding="utf-8")
 
     # 3) outline.md 저장(요약)
-    outline = get_field(scenario, "outline", {})
-    acts = get_field(outline, "acts", [])
-
-    def val(x, key):
-        # 씬이 dict일 수도, Pydantic 객체일 수도 있으므로 안전 접근
-        return getattr(x, key, x.get(key)) if isinstance(x, dict) else getattr(x, key, None)
-
-    lines = ["# Outline"]
-    for i, act in enumerate(acts, 1):
-        lines.append(f"\n## Act {i}")
-        for s in act:
-            sid = val(s, "id")
-            summary = val(s, "summary")
-            location = val(s, "location")
-            chars = val(s, "characters") or []
-            lines.append(f"- [{sid}] {summary} @ {location} ({', '.join(chars)})")
-
-    (out_dir / "outline.md").write_text("\n".join(lines), encoding="utf-8")
+    (out_dir / "outline.md").write_text(render_outline(scenario), encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -94,3 +59,7 @@ if __name__ == "__main__":
     print("\n".join(final["history"]))
     print("score:", final["eval"].score_overall, "| issues:", len(final["eval"].issues))
     save_outputs(final)
+    # 실행 이력은 덮어쓰지 않고 압축 JSONL 샤드에 누적
+    with OutputSink("outputs/runs") as sink:
+        run_id = sink.submit(final)
+    print("run_id:", run_id)
@@ -0,0 +1,38 @@
+from adapters.answer_text import json_scan_state, scan_json, truncate_after_json, truncate_at_stop
+
+
+def test_truncate_after_json_drops_trailing_text():
+    text = '```json\n{"a": 1, "b": {"c": [1, 2]}}\n```\n설명 텍스트'
+    assert truncate_after_json(text) == '```json\n{"a": 1, "b": {"c": [1, 2]}}'
+
+
+def test_braces_inside_strings_are_ignored():
+    text = '{"a": "}{", "b": "x\\"}"} tail'
+    assert truncate_after_json(text) == '{"a": "}{", "b": "x\\"}"}'
+
+
+def test_unclosed_object_is_left_unchanged():
+    assert truncate_after_json('{"a": {"b": 1}') == '{"a": {"b": 1}'
+    assert truncate_after_json("no json here") == "no json here"
+
+
+def test_scan_json_is_incremental_across_chunks():
+    # 토큰 단위로 잘려 들어와도 같은 결과
+    state = json_scan_state()
+    chunks = ['{"quests": [{"id"', ': "Q1", "summary": "a } b"', "}]", "}"]
+    ends = [scan_json(state, c) for c in chunks]
+    assert ends == [-1, -1, -1, 1]
+    assert state["done"]
+
+
+def test_escape_state_survives_chunk_boundary():
+    state = json_scan_state()
+    assert scan_json(state, '{"a": "x\\') == -1
+    assert scan_json(state, '"}"') == -1
+    assert scan_json(state, "}") == 1
+
+
+def test_truncate_at_stop_uses_earliest_match():
+    assert truncate_at_stop("answer<|end|>more</s>", ["</s>", "<|end|>"]) == "answer"
+    assert truncate_at_stop("answer", ["</s>"]) == "answer"
+    assert truncate_at_stop("answer", None) == "answer"
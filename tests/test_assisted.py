@@ -0,0 +1,17 @@
+from adapters.assisted import DecodingStats
+
+
+def test_acceptance_from_forward_counts():
+    # 본 모델 4회 검증으로 10토큰 → 6토큰이 draft 수락분
+    stats = DecodingStats(new_tokens=10, elapsed_s=2.0, target_forwards=4, draft_forwards=8)
+    assert stats.accepted_tokens == 6
+    assert stats.acceptance_rate == 0.75
+    assert stats.tokens_per_second == 5.0
+
+
+def test_no_draft_means_no_accepted_tokens():
+    # 배치(4행) 일반 디코딩: new_tokens 가 forward 수보다 커도 수락분은 0
+    stats = DecodingStats(new_tokens=40, elapsed_s=1.0, target_forwards=10, draft_forwards=0)
+    assert stats.accepted_tokens == 0
+    assert stats.acceptance_rate == 0.0
+    assert stats.as_dict()["accepted_tokens"] == 0
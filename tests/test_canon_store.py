@@ -0,0 +1,71 @@
+import struct
+
+import pytest
+
+from src.story_mas.schemas import WorldBible
+from src.story_mas.tools import canon_store
+from src.story_mas.tools.canon_store import CanonStore, iter_canon, open_store
+
+
+@pytest.fixture(autouse=True)
+def fresh_process_cache():
+    # 테스트마다 "새 프로세스" 상태에서 시작
+    canon_store._open_store.cache_clear()
+    yield
+    canon_store._open_store.cache_clear()
+
+
+def bible_for(ref) -> WorldBible:
+    return WorldBible(title="t", canon_store=ref, glossary={}, style_guide={})
+
+
+def test_roundtrip_including_empty_and_multibyte_chunks(tmp_path):
+    store = CanonStore.build(tmp_path, ["수도 루멘", "", "에코 코어"])
+    assert len(store) == 3
+    assert [store.get(i) for i in range(3)] == ["수도 루멘", "", "에코 코어"]
+    assert list(iter_canon(bible_for(store.ref()))) == ["수도 루멘", "", "에코 코어"]
+
+
+def test_ref_taken_before_append_stays_readable(tmp_path):
+    store = CanonStore.build(tmp_path, ["a", "b"])
+    old = store.ref()
+    assert list(iter_canon(bible_for(old))) == ["a", "b"]  # 캐시 핸들 생성
+
+    store.append("c")
+    new = store.ref()
+    assert list(iter_canon(bible_for(new))) == ["a", "b", "c"]
+    # 새 ref 로 캐시 핸들이 refresh 된 뒤에도, 새 프로세스에서도 이전 ref 는 그대로 읽힘
+    assert list(iter_canon(bible_for(old))) == ["a", "b"]
+    canon_store._open_store.cache_clear()
+    assert list(iter_canon(bible_for(old))) == ["a", "b"]
+
+
+def test_ref_for_different_content_is_rejected(tmp_path):
+    CanonStore.build(tmp_path / "one", ["a", "b"])
+    other = CanonStore.build(tmp_path / "two", ["a", "x"]).ref()
+    forged = other.model_copy(update={"path": str(tmp_path / "one")})
+    with pytest.raises(ValueError):
+        open_store(forged)
+
+
+def test_uncommitted_record_is_dropped_before_next_append(tmp_path):
+    store = CanonStore.build(tmp_path, ["a", "b"])
+    # canon.json 교체 직전에 죽은 append 흉내: 데이터/인덱스만 기록됨
+    with open(tmp_path / "canon.bin", "ab") as f:
+        f.write(b"partial")
+    with open(tmp_path / "canon.idx", "ab") as f:
+        f.write(struct.pack("<QQ16s", 2, 7, b"\0" * 16))
+
+    reopened = CanonStore(tmp_path)
+    assert len(reopened) == 2
+    assert reopened.append("c") == 2
+    assert [reopened.get(i) for i in range(3)] == ["a", "b", "c"]
+    assert (tmp_path / "canon.bin").read_bytes() == b"abc"
+
+
+def test_index_shorter_than_committed_count_is_rejected(tmp_path):
+    CanonStore.build(tmp_path, ["a", "b"])
+    with open(tmp_path / "canon.idx", "r+b") as f:
+        f.truncate(struct.calcsize("<QQ16s"))
+    with pytest.raises(ValueError):
+        CanonStore(tmp_path)
@@ -0,0 +1,58 @@
+import pytest
+
+from src.story_mas.schemas import PlotOutline, ScenarioDoc, Scene
+from src.story_mas.tools import output_sink
+from src.story_mas.tools.output_sink import OutputSink, RunArchive, load_run
+
+
+@pytest.fixture(autouse=True)
+def fresh_archive_cache():
+    output_sink._archive.cache_clear()
+    yield
+    output_sink._archive.cache_clear()
+
+
+def scenario(summary: str) -> ScenarioDoc:
+    scene = Scene(id="S1", summary=summary, location="루멘", characters=["주인공"], beats=[])
+    return ScenarioDoc(outline=PlotOutline(acts=[[scene]]), quests=[], dialogues=[])
+
+
+def test_submit_snapshots_state_before_later_mutation(tmp_path):
+    state = {"scenario": scenario("초안"), "eval": None, "history": ["writer"]}
+    with OutputSink(tmp_path) as sink:
+        run_id = sink.submit(state)
+        # 다음 반복에서 노드가 상태를 제자리에서 고치는 상황
+        state["scenario"].outline.acts[0][0].summary = "수정본"
+        state["history"].append("qa")
+
+    run = load_run(tmp_path, run_id)
+    assert run["scenario"]["outline"]["acts"][0][0]["summary"] == "초안"
+    assert run["history"] == ["writer"]
+
+
+def test_archive_reads_index_once_and_picks_up_new_runs(tmp_path):
+    with OutputSink(tmp_path, runs_per_shard=2) as sink:
+        ids = [sink.submit({"scenario": scenario(str(i))}) for i in range(3)]
+
+    archive = RunArchive(tmp_path)
+    assert [archive.load(r)["scenario"]["outline"]["acts"][0][0]["summary"] for r in ids] == ["0", "1", "2"]
+
+    with OutputSink(tmp_path) as sink:
+        later = sink.submit({"scenario": scenario("later")})
+    assert archive.load(later)["run_id"] == later
+    with pytest.raises(KeyError):
+        archive.load("missing")
+
+
+def test_submit_after_close_raises(tmp_path):
+    sink = OutputSink(tmp_path)
+    sink.close()
+    with pytest.raises(RuntimeError):
+        sink.submit({"scenario": None})
+
+
+def test_sinks_in_one_process_use_distinct_shards(tmp_path):
+    with OutputSink(tmp_path) as a, OutputSink(tmp_path) as b:
+        a.submit({"scenario": scenario("a")})
+        b.submit({"scenario": scenario("b")})
+    assert len(list((tmp_path / "shards").iterdir())) == 2
@@ -0,0 +1,78 @@
+from src.story_mas.schemas import DialogueLine, PlotOutline, Quest, ScenarioDoc, Scene
+from src.story_mas.tools.quest_graph import QuestGraph
+
+
+def scene(sid: str) -> Scene:
+    return Scene(id=sid, summary="", location="", characters=[], beats=[])
+
+
+def quest(qid: str, prerequisites=(), related_scenes=()) -> Quest:
+    return Quest(id=qid, name=qid, summary="", prerequisites=list(prerequisites), related_scenes=list(related_scenes))
+
+
+def line(scene_id: str) -> DialogueLine:
+    return DialogueLine(scene_id=scene_id, speaker="주인공", text="...")
+
+
+def issues_by_message(scenario: ScenarioDoc) -> dict[str, list[str]]:
+    return {i.message: i.refs for i in QuestGraph.build(scenario).issues()}
+
+
+def test_clean_scenario_has_no_issues():
+    scenario = ScenarioDoc(
+        outline=PlotOutline(acts=[[scene("S1"), scene("S2")]]),
+        quests=[quest("A", related_scenes=["S1"]), quest("B", prerequisites=["A"], related_scenes=["S2"])],
+        dialogues=[line("S1")],
+    )
+    assert QuestGraph.build(scenario).issues() == []
+
+
+def test_each_root_cause_reported_once():
+    scenario = ScenarioDoc(
+        outline=PlotOutline(acts=[[scene("S1"), scene("S2")], [scene("S3")]]),
+        quests=[
+            quest("A", related_scenes=["S1"]),
+            quest("B", prerequisites=["C"], related_scenes=["S9"]),
+            quest("C", prerequisites=["B"]),
+            quest("D", prerequisites=["X"]),
+            quest("E", prerequisites=["B"]),
+        ],
+        dialogues=[line("S2"), line("S7")],
+    )
+    issues = issues_by_message(scenario)
+    assert issues["존재하지 않는 선행 퀘스트 참조"] == ["D->quest:X"]
+    assert issues["존재하지 않는 장면 링크"] == ["B->scene:S9"]
+    assert issues["대사의 장면 ID 불일치"] == ["dialogue[1]->scene:S7"]
+    assert issues["선행 퀘스트 순환"] == ["B -> C -> B"]
+    # B/C(순환)와 D(끊어진 선행)는 중복 보고하지 않고 여파로 막힌 E 만 나열
+    assert issues["도달 불가 퀘스트(선행 퀘스트 막힘)"] == ["E"]
+    assert issues["고립 장면(퀘스트/대사 없음)"] == ["S3"]
+
+
+def test_self_prerequisite_is_a_cycle():
+    scenario = ScenarioDoc(
+        outline=PlotOutline(acts=[[scene("S1")]]),
+        quests=[quest("A", prerequisites=["A"], related_scenes=["S1"])],
+        dialogues=[],
+    )
+    issues = issues_by_message(scenario)
+    assert issues == {"선행 퀘스트 순환": ["A -> A"]}
+
+
+def test_duplicate_ids():
+    scenario = ScenarioDoc(
+        outline=PlotOutline(acts=[[scene("S1"), scene("S1")]]),
+        quests=[quest("A", related_scenes=["S1"]), quest("A")],
+        dialogues=[],
+    )
+    assert issues_by_message(scenario) == {"중복 ID": ["quest:A", "scene:S1"]}
+
+
+def test_long_prerequisite_chain_is_reachable():
+    # 재귀 없이 처리되는지(깊은 체인에서도 RecursionError 없음)
+    n = 5000
+    quests = [quest("Q0", related_scenes=["S1"])] + [quest(f"Q{i}", prerequisites=[f"Q{i - 1}"]) for i in range(1, n)]
+    scenario = ScenarioDoc(outline=PlotOutline(acts=[[scene("S1")]]), quests=quests, dialogues=[])
+    graph = QuestGraph.build(scenario)
+    assert graph.issues() == []
+    assert len(graph.reachable_quests()) == n